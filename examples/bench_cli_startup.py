@@ -0,0 +1,169 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+EXAMPLES_DIR = os.path.dirname(os.path.abspath(__file__))
+CLI_PATH = os.path.join(EXAMPLES_DIR, "cli.py")
+HEAVY_MODULES = ("requests", "urllib3", "dotenv")
+
+
+class IngestionHandler(BaseHTTPRequestHandler):
+    """Stands in for IP Copilot's Ingestion Endpoint, accepting every payload"""
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.send_response(200)
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+def get_benchmarks(payload_file: str) -> dict[str, list[str]]:
+    """Builds the commands to benchmark
+
+    Args:
+        payload_file (str): A json file with a payload for replay runs
+
+    Returns:
+        dict[str, list[str]]: The commands to benchmark keyed by name
+    """
+    return {
+        "python (baseline)": [sys.executable, "-c", "pass"],
+        "import requests": [sys.executable, "-c", "import requests"],
+        "cli.py --help": [sys.executable, CLI_PATH, "--help"],
+        # Dry runs, these never import requests or send payloads
+        "plan simple (dry run)": [sys.executable, CLI_PATH, "plan", "simple"],
+        "plan coda (dry run)": [sys.executable, CLI_PATH, "plan", "coda"],
+        # A scheduled incremental run, sending one payload to a local server
+        "replay (1 payload)": [
+            sys.executable,
+            CLI_PATH,
+            "replay",
+            payload_file,
+        ],
+    }
+
+
+def time_command(
+    command: list[str], runs: int, env: dict[str, str]
+) -> tuple[list[float], int]:
+    """Times a command over a number of runs
+
+    Args:
+        command (list[str]): The command to run
+        runs (int): The number of times to run the command
+        env (dict[str, str]): The environment to run the command with
+
+    Returns:
+        tuple[list[float], int]: The wall time of each run in milliseconds
+            and the first non zero exit code, 0 if every run succeeded
+    """
+    timings = []
+    returncode = 0
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = subprocess.run(
+            command,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            cwd=EXAMPLES_DIR,
+            env=env,
+        )
+        timings.append((time.perf_counter() - start) * 1000)
+        if result.returncode != 0:
+            returncode = result.returncode
+            break
+    return timings, returncode
+
+
+def heavy_modules_imported(
+    command: list[str], env: dict[str, str]
+) -> list[str]:
+    """Lists the heavy modules imported when running a command
+
+    Args:
+        command (list[str]): The command to run
+        env (dict[str, str]): The environment to run the command with
+
+    Returns:
+        list[str]: The names of heavy modules found in the import trace
+    """
+    result = subprocess.run(
+        [command[0], "-X", "importtime", *command[1:]],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        cwd=EXAMPLES_DIR,
+        env=env,
+    )
+    imported = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        module_name = line.rsplit("|", 1)[-1].strip()
+        if module_name in HEAVY_MODULES:
+            imported.add(module_name)
+    return sorted(imported)
+
+
+def main(runs: int):
+    """
+    Benchmarks the startup time of the CLI for frequent scheduled runs
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), IngestionHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    # Config is set so every command is expected to exit 0
+    env = {
+        **os.environ,
+        "IPCOPILOT_ORG_API_KEY": "benchmark-key",
+        "IPCOPILOT_INGESTION_ENDPOINT": f"http://127.0.0.1:{server.server_port}",
+        "CODA_API_TOKEN": "benchmark-token",
+    }
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            payload_file = os.path.join(tmp_dir, "payloads.json")
+            with open(payload_file, "w") as f:
+                json.dump({"author": "benchmark", "source": "benchmark"}, f)
+
+            print(
+                f"{'command':<24}{'min ms':>10}{'median ms':>12}  heavy imports"
+            )
+            for name, command in get_benchmarks(payload_file).items():
+                timings, returncode = time_command(command, runs, env)
+                if returncode != 0:
+                    print(f"{name:<24}{'failed with exit code':>22} {returncode}")
+                    continue
+                heavy_imports = (
+                    ", ".join(heavy_modules_imported(command, env)) or "-"
+                )
+                print(
+                    f"{name:<24}{min(timings):>10.1f}"
+                    f"{statistics.median(timings):>12.1f}  {heavy_imports}"
+                )
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    _parser = argparse.ArgumentParser(
+        description="Benchmark the startup time of cli.py subcommands."
+    )
+    _parser.add_argument(
+        "--runs",
+        type=int,
+        default=20,
+        help="number of times each command is run",
+    )
+    _args = _parser.parse_args()
+
+    main(_args.runs)
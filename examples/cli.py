@@ -0,0 +1,250 @@
+import argparse
+import importlib.util
+import json
+import os
+import sys
+
+
+# Heavy dependencies (requests, dotenv) are only imported by the example
+# modules once a subcommand actually needs them, so the examples can be
+# loaded to build the parser and this module's top level imports are kept
+# to the standard library
+EXAMPLES_DIR = os.path.dirname(os.path.abspath(__file__))
+PLAN_TARGETS = ("simple", "coda", "replay")
+
+
+def load_example(name: str):
+    """Imports an example script as a module from its folder
+
+    Args:
+        name (str): The name of the example folder (simple, coda)
+
+    Returns:
+        module: The `{name}_ingestion` module of the example
+    """
+    module_name = f"{name}_ingestion"
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+
+    spec = importlib.util.spec_from_file_location(
+        module_name, os.path.join(EXAMPLES_DIR, name, f"{module_name}.py")
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def read_payloads(path: str) -> list[dict]:
+    """Reads IP Copilot ingestion payloads from a json file
+
+    Args:
+        path (str): The path to a json file containing a payload dict or a
+            list of payload dicts, or "-" to read from stdin
+
+    Raises:
+        OSError: The file could not be read
+        json.JSONDecodeError: The file does not contain valid json
+        ValueError: The json is not a payload dict or a list of payload dicts
+
+    Returns:
+        list[dict]: The payloads in the file
+    """
+    if path == "-":
+        payloads = json.load(sys.stdin)
+    else:
+        with open(path) as payload_file:
+            payloads = json.load(payload_file)
+
+    if isinstance(payloads, dict):
+        payloads = [payloads]
+    if not isinstance(payloads, list) or not all(
+        isinstance(payload, dict) for payload in payloads
+    ):
+        raise ValueError(
+            f"{path} must contain a payload dict or a list of payload dicts"
+        )
+    return payloads
+
+
+def load_configured_example(name: str, args: argparse.Namespace):
+    """Loads an example and sets its config from parsed arguments
+
+    Args:
+        name (str): The name of the example folder (simple, coda)
+        args (argparse.Namespace): The parsed subcommand arguments
+
+    Returns:
+        module | None: The configured example module, or None if a required
+            config value is missing
+    """
+    example = load_example(name)
+    example.set_config(example.config_from_args(args))
+    try:
+        example.validate_args_and_env()
+    except ValueError as e:
+        print(e)
+        return None
+    return example
+
+
+def run_simple(args: argparse.Namespace) -> int:
+    """Sends the simple example payloads
+
+    Returns:
+        int: 0 if the payloads were sent, 1 if config is missing or any
+            payload failed to send
+    """
+    simple_ingestion = load_configured_example("simple", args)
+    if simple_ingestion is None:
+        return 1
+    return 1 if simple_ingestion.main() else 0
+
+
+def run_coda(args: argparse.Namespace) -> int:
+    """Pulls pages from coda and sends them for ingestion
+
+    Returns:
+        int: 0 once the run completes, 1 if config is missing
+    """
+    coda_ingestion = load_configured_example("coda", args)
+    if coda_ingestion is None:
+        return 1
+    coda_ingestion.main()
+    return 0
+
+
+def run_replay(args: argparse.Namespace) -> int:
+    """Sends previously saved payloads to IP Copilot's Ingestion Endpoint
+
+    Returns:
+        int: 0 if every payload was accepted, 1 if the payload file or
+            config is invalid or any payload failed to send
+    """
+    try:
+        payloads = read_payloads(args.payload_file)
+    except (OSError, json.JSONDecodeError, ValueError) as e:
+        print(f"Could not read payloads: {e}")
+        return 1
+
+    simple_ingestion = load_configured_example("simple", args)
+    if simple_ingestion is None:
+        return 1
+    n_failed = simple_ingestion.send_to_ipcopilot_ingestion_endpoint(payloads)
+    if n_failed:
+        print(f"{n_failed} of {len(payloads)} payloads failed to send")
+        return 1
+    return 0
+
+
+def run_plan(args: argparse.Namespace) -> int:
+    """Prints what a subcommand would do without sending any requests
+
+    Returns:
+        int: 0 if the target is ready to run, 1 if config or the payload
+            file is invalid
+    """
+    example = load_example("simple" if args.target == "replay" else args.target)
+    config = example.config_from_args(args)
+    example.set_config(config)
+
+    print(f"Target: {args.target}")
+    for field_name, value in vars(config).items():
+        if value is not None and field_name.endswith(("_key", "_token")):
+            value = "<set>"
+        print(f"  {field_name}: {value}")
+
+    is_ready = True
+    try:
+        example.validate_args_and_env()
+    except ValueError as e:
+        print(e)
+        is_ready = False
+
+    if args.target == "simple":
+        print(f"Payloads to send: {len(example.get_payloads())}")
+    elif args.target == "replay":
+        if args.payload_file is None:
+            print("A payload file is required to plan a replay")
+            return 1
+        try:
+            payloads = read_payloads(args.payload_file)
+        except (OSError, json.JSONDecodeError, ValueError) as e:
+            print(f"Could not read payloads: {e}")
+            return 1
+        print(f"Payloads to send: {len(payloads)} from {args.payload_file}")
+    else:
+        print(f"Docs and pages to pull from: {example.CODA_BASE_URL}")
+
+    return 0 if is_ready else 1
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Run IP Copilot integration examples."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    simple_parser = subparsers.add_parser(
+        "simple", help="send the simple example payloads"
+    )
+    simple_parser.set_defaults(func=run_simple)
+
+    coda_parser = subparsers.add_parser(
+        "coda", help="pull pages from coda and send them for ingestion"
+    )
+    coda_parser.set_defaults(func=run_coda)
+
+    replay_parser = subparsers.add_parser(
+        "replay", help="send payloads saved in a json file"
+    )
+    replay_parser.add_argument(
+        "payload_file",
+        help="json file with a payload or list of payloads, '-' for stdin",
+    )
+    replay_parser.set_defaults(func=run_replay)
+
+    plan_parser = subparsers.add_parser(
+        "plan",
+        help="show the resolved config and what would be sent, without sending",
+    )
+    plan_parser.add_argument("target", choices=PLAN_TARGETS)
+    plan_parser.add_argument(
+        "payload_file",
+        nargs="?",
+        default=None,
+        help="json file of payloads when planning a replay",
+    )
+    plan_parser.set_defaults(func=run_plan, subparser=plan_parser)
+
+    # Config arguments are defined once by each example, coda's include
+    # every argument so plan uses them for all targets and main rejects
+    # the coda only ones for other targets
+    simple_ingestion = load_example("simple")
+    coda_ingestion = load_example("coda")
+    for subparser in (simple_parser, replay_parser):
+        simple_ingestion.add_config_arguments(subparser)
+    for subparser in (coda_parser, plan_parser):
+        coda_ingestion.add_config_arguments(subparser)
+
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.command == "plan":
+        if args.target != "replay" and args.payload_file is not None:
+            args.subparser.error(
+                "payload_file is only used when planning a replay, "
+                f"not {args.target}"
+            )
+        if args.target != "coda" and args.coda_api_token is not None:
+            args.subparser.error(
+                "--coda-api-token is only used when planning coda, "
+                f"not {args.target}"
+            )
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
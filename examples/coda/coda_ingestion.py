@@ -2,27 +2,89 @@ import argparse
 import datetime
 import os
 import time
+from dataclasses import dataclass
 from typing import Generator
 
-import requests
-from dotenv import load_dotenv
 
+# coda api params
+CODA_BASE_URL = "https://coda.io/apis/v1"
 
-# setup environment
-load_dotenv()
 
+@dataclass(frozen=True)
+class Config:
+    """Settings required to pull from coda and send to IP Copilot
 
-# ipcopilot api params
-IPCOPILOT_ORG_API_KEY = os.environ.get("IPCOPILOT_ORG_API_KEY", None)
-IPCOPILOT_INGESTION_ENDPOINT = os.environ.get(
-    "IPCOPILOT_INGESTION_ENDPOINT", None
-)
-IPCOPILOT_MAX_RETRIES = 5
+    Attributes:
+        ipcopilot_org_api_key (str | None): ipcopilot org api key
+        ipcopilot_ingestion_endpoint (str | None): ipcopilot api url
+        coda_api_token (str | None): coda api token
+        ipcopilot_max_retries (int): The number of retries on a rate limited
+            ingestion request
+    """
 
+    ipcopilot_org_api_key: str | None = None
+    ipcopilot_ingestion_endpoint: str | None = None
+    coda_api_token: str | None = None
+    ipcopilot_max_retries: int = 5
+
+    @classmethod
+    def from_env(
+        cls,
+        ipcopilot_org_api_key: str | None = None,
+        ipcopilot_ingestion_endpoint: str | None = None,
+        coda_api_token: str | None = None,
+    ) -> "Config":
+        """Resolves the config from the passed in values, falling back to
+            environment vars (and a `.env` file) for any value not passed in
+
+        Args:
+            ipcopilot_org_api_key (str | None, optional): Overrides env
+                IPCOPILOT_ORG_API_KEY. Defaults to None.
+            ipcopilot_ingestion_endpoint (str | None, optional): Overrides env
+                IPCOPILOT_INGESTION_ENDPOINT. Defaults to None.
+            coda_api_token (str | None, optional): Overrides env
+                CODA_API_TOKEN. Defaults to None.
+
+        Returns:
+            Config: The resolved config
+        """
+        from dotenv import load_dotenv
+
+        load_dotenv()
+        return cls(
+            ipcopilot_org_api_key=ipcopilot_org_api_key
+            or os.environ.get("IPCOPILOT_ORG_API_KEY", None),
+            ipcopilot_ingestion_endpoint=ipcopilot_ingestion_endpoint
+            or os.environ.get("IPCOPILOT_INGESTION_ENDPOINT", None),
+            coda_api_token=coda_api_token
+            or os.environ.get("CODA_API_TOKEN", None),
+        )
 
-# coda api params
-CODA_API_TOKEN = os.environ.get("CODA_API_TOKEN", None)
-CODA_BASE_URL = "https://coda.io/apis/v1"
+
+_config: Config | None = None
+
+
+def get_config() -> Config:
+    """Returns the active config, resolving it from the environment on
+        first use
+
+    Returns:
+        Config: The active config
+    """
+    global _config
+    if _config is None:
+        _config = Config.from_env()
+    return _config
+
+
+def set_config(config: Config):
+    """Sets the active config used by the functions of this module
+
+    Args:
+        config (Config): The config to use
+    """
+    global _config
+    _config = config
 
 
 # General params
@@ -32,7 +94,7 @@ DOC_RESULTS_BORDER = "-" * 50
 
 def get_coda_headers():
     return {
-        "Authorization": f"Bearer {CODA_API_TOKEN}",
+        "Authorization": f"Bearer {get_config().coda_api_token}",
         "X-Coda-Doc-Version": "latest",  # Ensures the latest copy of the data pulled
     }
 
@@ -40,7 +102,7 @@ def get_coda_headers():
 def get_ipcopilot_headers():
     return {
         "Content-Type": "application/json",  # Tell the server to expect JSON
-        "Authorization": f"Bearer {IPCOPILOT_ORG_API_KEY}",
+        "Authorization": f"Bearer {get_config().ipcopilot_org_api_key}",
     }
 
 
@@ -59,6 +121,8 @@ def initiate_coda_page_content_export_request(
     Returns:
         str: A request id to pull the metadata of a content export request
     """
+    import requests
+
     payload = {
         "outputFormat": "markdown",
     }
@@ -97,6 +161,8 @@ def pull_exported_coda_page_content(
         str | None: Either the cotent str (in markdown) exported by coda
             or null if the pull of content has timed out
     """
+    import requests
+
     status_res_dict = None
     retries = 0
     # Wait for status of content downloadLink to be "complete"
@@ -217,6 +283,8 @@ def iter_content_metadata_pulled_from_coda(
         Generator[dict[any]]: iterable of coda item dict in responses
             from endpoints
     """
+    import requests
+
     headers = get_coda_headers()
     params = {}
     while True:
@@ -355,6 +423,9 @@ def send_to_ipcopilot_ingestion_endpoint(payloads: list[dict]):
         payloads (list[dict]): The list of formatted payloads containing
             ingestible markdown for idea extraction
     """
+    import requests
+
+    config = get_config()
     n_payloads = len(payloads)
     default_retry_wait_seconds = 15
     try:
@@ -362,10 +433,11 @@ def send_to_ipcopilot_ingestion_endpoint(payloads: list[dict]):
             response = None
             retries = 0
             while response is None or (
-                response.status_code == 429 and IPCOPILOT_MAX_RETRIES > retries
+                response.status_code == 429
+                and config.ipcopilot_max_retries > retries
             ):
                 response = requests.post(
-                    IPCOPILOT_INGESTION_ENDPOINT,
+                    config.ipcopilot_ingestion_endpoint,
                     json=payload,
                     headers=get_ipcopilot_headers(),
                     allow_redirects=False,
@@ -388,7 +460,7 @@ def send_to_ipcopilot_ingestion_endpoint(payloads: list[dict]):
                 elif response.status_code >= 400:
                     status_msg = f"Request failed with status {response.status_code}: {response.text}"
 
-            if IPCOPILOT_MAX_RETRIES < retries:
+            if config.ipcopilot_max_retries < retries:
                 status_msg = f"Max retries exceeded for Payload {idx + 1} of {n_payloads}"
 
             print(status_msg)
@@ -398,17 +470,18 @@ def send_to_ipcopilot_ingestion_endpoint(payloads: list[dict]):
 
 
 def validate_args_and_env():
-    """Validates all global vars required for the script are set
+    """Validates all config values required for the script are set
 
     Raises:
         ValueError: A value is missing from one or more required vars
     """
+    config = get_config()
     missing_values = []
-    if IPCOPILOT_ORG_API_KEY is None:
+    if config.ipcopilot_org_api_key is None:
         missing_values.append("IPCOPILOT_ORG_API_KEY")
-    if CODA_API_TOKEN is None:
+    if config.coda_api_token is None:
         missing_values.append("CODA_API_TOKEN")
-    if IPCOPILOT_INGESTION_ENDPOINT is None:
+    if config.ipcopilot_ingestion_endpoint is None:
         missing_values.append("IPCOPILOT_INGESTION_ENDPOINT")
 
     if missing_values:
@@ -419,11 +492,69 @@ def validate_args_and_env():
         )
 
 
-def main():
+def add_config_arguments(parser: argparse.ArgumentParser):
+    """Adds the arguments used to override env config to a parser
+
+    Args:
+        parser (argparse.ArgumentParser): The parser to add arguments to
+    """
+    parser.add_argument(
+        "--ipcopilot-org-api-key",
+        type=str,
+        default=None,
+        help=(
+            "ipcopilot org api key, alternatively can be set with "
+            "env IPCOPILOT_ORG_API_KEY"
+        ),
+    )
+    parser.add_argument(
+        "--coda-api-token",
+        type=str,
+        default=None,
+        help=(
+            "coda api token, alternatively can be set with "
+            "env CODA_API_TOKEN"
+        ),
+    )
+    parser.add_argument(
+        "--ipcopilot-ingestion-endpoint",
+        type=str,
+        default=None,
+        help=(
+            "ipcopilot api url, alternatively can be set with "
+            "env IPCOPILOT_INGESTION_ENDPOINT"
+        ),
+    )
+
+
+def config_from_args(args: argparse.Namespace) -> Config:
+    """Resolves the config from parsed arguments, falling back to env vars
+
+    Args:
+        args (argparse.Namespace): Arguments parsed by a parser set up
+            with `add_config_arguments`
+
+    Returns:
+        Config: The resolved config
+    """
+    return Config.from_env(
+        ipcopilot_org_api_key=args.ipcopilot_org_api_key,
+        ipcopilot_ingestion_endpoint=args.ipcopilot_ingestion_endpoint,
+        coda_api_token=args.coda_api_token,
+    )
+
+
+def main(config: Config | None = None):
     """
     Pulls page data from coda and sends it to IP Copilot's Ingestion Endpoint
         for processing
+
+    Args:
+        config (Config | None, optional): The config to run with, resolved
+            from the environment if not passed in. Defaults to None.
     """
+    if config is not None:
+        set_config(config)
     validate_args_and_env()
 
     total_docs_processed = 0
@@ -465,43 +596,8 @@ if __name__ == "__main__":
     _parser = argparse.ArgumentParser(
         description="Set API tokens and domain if not already set in environment variables."
     )
-
-    _parser.add_argument(
-        "--ipcopilot-org-api-key",
-        type=str,
-        default=None,
-        help=(
-            "ipcopilot org api key, alternatively can be set with "
-            "env IPCOPILOT_ORG_API_KEY"
-        ),
-    )
-    _parser.add_argument(
-        "--coda-api-token",
-        type=str,
-        default=None,
-        help=(
-            "coda api token, alternatively can be set with "
-            "env CODA_API_TOKEN"
-        ),
-    )
-    _parser.add_argument(
-        "--ipcopilot-ingestion-endpoint",
-        type=str,
-        default=None,
-        help=(
-            "ipcopilot api url, alternatively can be set with "
-            "env IPCOPILOT_INGESTION_ENDPOINT"
-        ),
-    )
-
+    add_config_arguments(_parser)
     _args = _parser.parse_args()
 
     # Use argparse values if they are passed in, otherwise use environment variables
-    if _args.ipcopilot_org_api_key:
-        IPCOPILOT_ORG_API_KEY = _args.ipcopilot_org_api_key
-    if _args.coda_api_token:
-        CODA_API_TOKEN = _args.coda_api_token
-    if _args.ipcopilot_ingestion_endpoint:
-        IPCOPILOT_INGESTION_ENDPOINT = _args.ipcopilot_ingestion_endpoint
-
-    main()
+    main(config_from_args(_args))
@@ -2,60 +2,125 @@ import argparse
 import datetime
 import os
 import time
+from dataclasses import dataclass
 
-import requests
-from dotenv import load_dotenv
 
+#################### CONFIG ####################
+@dataclass(frozen=True)
+class Config:
+    """Settings required to send payloads to IP Copilot's Ingestion API
+
+    Attributes:
+        ipcopilot_org_api_key (str | None): ipcopilot org api key
+        ipcopilot_ingestion_endpoint (str | None): ipcopilot api url
+        max_retries (int): The number of retries on a rate limited request
+    """
 
-# setup environment
-load_dotenv()
+    ipcopilot_org_api_key: str | None = None
+    ipcopilot_ingestion_endpoint: str | None = None
+    max_retries: int = 5
+
+    @classmethod
+    def from_env(
+        cls,
+        ipcopilot_org_api_key: str | None = None,
+        ipcopilot_ingestion_endpoint: str | None = None,
+    ) -> "Config":
+        """Resolves the config from the passed in values, falling back to
+            environment vars (and a `.env` file) for any value not passed in
+
+        Args:
+            ipcopilot_org_api_key (str | None, optional): Overrides env
+                IPCOPILOT_ORG_API_KEY. Defaults to None.
+            ipcopilot_ingestion_endpoint (str | None, optional): Overrides env
+                IPCOPILOT_INGESTION_ENDPOINT. Defaults to None.
+
+        Returns:
+            Config: The resolved config
+        """
+        from dotenv import load_dotenv
+
+        load_dotenv()
+        return cls(
+            ipcopilot_org_api_key=ipcopilot_org_api_key
+            or os.environ.get("IPCOPILOT_ORG_API_KEY", None),
+            ipcopilot_ingestion_endpoint=ipcopilot_ingestion_endpoint
+            or os.environ.get("IPCOPILOT_INGESTION_ENDPOINT", None),
+        )
+
+
+_config: Config | None = None
+
+
+def get_config() -> Config:
+    """Returns the active config, resolving it from the environment on
+        first use
+
+    Returns:
+        Config: The active config
+    """
+    global _config
+    if _config is None:
+        _config = Config.from_env()
+    return _config
+
+
+def set_config(config: Config):
+    """Sets the active config used by the functions of this module
+
+    Args:
+        config (Config): The config to use
+    """
+    global _config
+    _config = config
 
 
-#################### CONFIG ####################
-# API Config
-IPCOPILOT_ORG_API_KEY = os.environ.get("IPCOPILOT_ORG_API_KEY", None)
-IPCOPILOT_INGESTION_ENDPOINT = os.environ.get(
-    "IPCOPILOT_INGESTION_ENDPOINT", None
-)
-
-# General Config
-MAX_RETRIES = 5
 ###############################################
 
 
-# api params
-headers = {
-    "Content-Type": "application/json",
-    "Authorization": f"Bearer {IPCOPILOT_ORG_API_KEY}",
-}
+def get_ipcopilot_headers():
+    return {
+        "Content-Type": "application/json",
+        "Authorization": f"Bearer {get_config().ipcopilot_org_api_key}",
+    }
+
 
+def get_payloads() -> list[dict]:
+    """Builds the example payloads, timestamped at the time of the call
 
-payloads = [
-    {
-        "author": "fake_user_id",
-        "source": "fake_source",
-        "email": "fake_email@email.com",
-        "comment_text": "fake comment test",
-        "comment_link": "https://fake-url.com",
-        "content_title": "",
-        "content_link": None,
-        "discussion_link": None,
-        "context_link": "https://another-fake-url.com",
-        "created_at": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-    },
-]
+    Returns:
+        list[dict]: The list of payloads in the IP Copilot Ingestion API
+            payload format
+    """
+    return [
+        {
+            "author": "fake_user_id",
+            "source": "fake_source",
+            "email": "fake_email@email.com",
+            "comment_text": "fake comment test",
+            "comment_link": "https://fake-url.com",
+            "content_title": "",
+            "content_link": None,
+            "discussion_link": None,
+            "context_link": "https://another-fake-url.com",
+            "created_at": datetime.datetime.now().strftime(
+                "%Y-%m-%d %H:%M:%S"
+            ),
+        },
+    ]
 
 
 def validate_args_and_env():
-    """Validates all global vars required for the script are set
+    """Validates all config values required for the script are set
 
     Raises:
         ValueError: A value is missing from one or more required vars
     """
+    config = get_config()
     missing_values = []
-    if IPCOPILOT_ORG_API_KEY is None:
+    if config.ipcopilot_org_api_key is None:
         missing_values.append("IPCOPILOT_ORG_API_KEY")
-    if IPCOPILOT_INGESTION_ENDPOINT is None:
+    if config.ipcopilot_ingestion_endpoint is None:
         missing_values.append("IPCOPILOT_INGESTION_ENDPOINT")
 
     if missing_values:
@@ -66,55 +131,79 @@ def validate_args_and_env():
         )
 
 
-def main():
-    """
-    Sends payloads to IP Copilot's Ingestion API for processing
+def send_to_ipcopilot_ingestion_endpoint(payloads: list[dict]) -> int:
+    """Sends a list of payloads to IP Copilot's ingest endpoint
+
+    Args:
+        payloads (list[dict]): The list of payloads in the IP Copilot
+            Ingestion API payload format
+
+    Returns:
+        int: The number of payloads that failed to send, including those
+            that ran out of retries or could not reach the endpoint
     """
-    validate_args_and_env()
+    import requests
 
+    config = get_config()
+    headers = get_ipcopilot_headers()
     response = None
     retries = 0
     n_payloads = len(payloads)
+    n_failed = 0
     default_retry_wait_time = 15  # seconds
     for idx, payload in enumerate(payloads):
         response = None
         retries = 0
-        while response is None or (
-            response.status_code == 429 and MAX_RETRIES > retries
-        ):
-            response = requests.post(
-                IPCOPILOT_INGESTION_ENDPOINT, json=payload, headers=headers
-            )
-            # Handle the response
-            status_msg = f"Payload {idx} of {n_payloads} processed sucessfully"
-            if response.status_code == 429:
-                print(
-                    f"Request failed with rate limit status {response.status_code}: {response.text}"
+        try:
+            while response is None or (
+                response.status_code == 429 and config.max_retries > retries
+            ):
+                response = requests.post(
+                    config.ipcopilot_ingestion_endpoint,
+                    json=payload,
+                    headers=headers,
                 )
-                retry_sleep_time = response.headers.get(
-                    "Retry-After", default_retry_wait_time
+                # Handle the response
+                status_msg = (
+                    f"Payload {idx} of {n_payloads} processed sucessfully"
                 )
-                print(f"retrying in {retry_sleep_time} seconds")
-                time.sleep(int(retry_sleep_time))
-                retries += 1
+                if response.status_code == 429:
+                    print(
+                        f"Request failed with rate limit status {response.status_code}: {response.text}"
+                    )
+                    retry_sleep_time = response.headers.get(
+                        "Retry-After", default_retry_wait_time
+                    )
+                    print(f"retrying in {retry_sleep_time} seconds")
+                    time.sleep(int(retry_sleep_time))
+                    retries += 1
 
-            elif response.status_code >= 400:
-                status_msg = f"Request failed with status {response.status_code}: {response.text}"
+                elif response.status_code >= 400:
+                    status_msg = f"Request failed with status {response.status_code}: {response.text}"
+        except requests.RequestException as e:
+            print(f"Request failed for Payload {idx} of {n_payloads}: {e}")
+            n_failed += 1
+            continue
 
-        if MAX_RETRIES <= retries:
+        if config.max_retries <= retries:
             status_msg = (
                 f"Max retries exceeded for Payload {idx} of {n_payloads}"
             )
+        if response.status_code >= 400:
+            n_failed += 1
 
         print(status_msg)
 
+    return n_failed
 
-if __name__ == "__main__":
-    _parser = argparse.ArgumentParser(
-        description="Set API tokens and URL if not already set in environment variables."
-    )
 
-    _parser.add_argument(
+def add_config_arguments(parser: argparse.ArgumentParser):
+    """Adds the arguments used to override env config to a parser
+
+    Args:
+        parser (argparse.ArgumentParser): The parser to add arguments to
+    """
+    parser.add_argument(
         "--ipcopilot-org-api-key",
         type=str,
         default=None,
@@ -123,7 +212,7 @@ if __name__ == "__main__":
             "env IPCOPILOT_ORG_API_KEY"
         ),
     )
-    _parser.add_argument(
+    parser.add_argument(
         "--ipcopilot-ingestion-endpoint",
         type=str,
         default=None,
@@ -133,12 +222,47 @@ if __name__ == "__main__":
         ),
     )
 
+
+def config_from_args(args: argparse.Namespace) -> Config:
+    """Resolves the config from parsed arguments, falling back to env vars
+
+    Args:
+        args (argparse.Namespace): Arguments parsed by a parser set up
+            with `add_config_arguments`
+
+    Returns:
+        Config: The resolved config
+    """
+    return Config.from_env(
+        ipcopilot_org_api_key=args.ipcopilot_org_api_key,
+        ipcopilot_ingestion_endpoint=args.ipcopilot_ingestion_endpoint,
+    )
+
+
+def main(config: Config | None = None) -> int:
+    """
+    Sends payloads to IP Copilot's Ingestion API for processing
+
+    Args:
+        config (Config | None, optional): The config to run with, resolved
+            from the environment if not passed in. Defaults to None.
+
+    Returns:
+        int: The number of payloads that failed to send
+    """
+    if config is not None:
+        set_config(config)
+    validate_args_and_env()
+
+    return send_to_ipcopilot_ingestion_endpoint(get_payloads())
+
+
+if __name__ == "__main__":
+    _parser = argparse.ArgumentParser(
+        description="Set API tokens and URL if not already set in environment variables."
+    )
+    add_config_arguments(_parser)
     _args = _parser.parse_args()
 
     # Use argparse values if they are passed in, otherwise use environment variables
-    if _args.ipcopilot_org_api_key:
-        IPCOPILOT_ORG_API_KEY = _args.ipcopilot_org_api_key
-    if _args.ipcopilot_ingestion_endpoint:
-        IPCOPILOT_INGESTION_ENDPOINT = _args.ipcopilot_ingestion_endpoint
-
-    main()
+    main(config_from_args(_args))
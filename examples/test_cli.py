@@ -0,0 +1,159 @@
+import importlib.util
+import io
+import json
+
+import pytest
+
+import cli
+
+
+# Resolving config loads the `.env` file, so paths that resolve it need
+# python-dotenv from the examples' requirements
+requires_dotenv = pytest.mark.skipif(
+    importlib.util.find_spec("dotenv") is None,
+    reason="python-dotenv is not installed",
+)
+
+
+@pytest.fixture
+def env(monkeypatch):
+    """Sets every config env var, returning them for assertions"""
+    values = {
+        "IPCOPILOT_ORG_API_KEY": "secret-org-key",
+        "IPCOPILOT_INGESTION_ENDPOINT": "http://127.0.0.1:9/ingest",
+        "CODA_API_TOKEN": "secret-coda-token",
+    }
+    for name, value in values.items():
+        monkeypatch.setenv(name, value)
+    return values
+
+
+@pytest.fixture
+def no_env(monkeypatch):
+    for name in (
+        "IPCOPILOT_ORG_API_KEY",
+        "IPCOPILOT_INGESTION_ENDPOINT",
+        "CODA_API_TOKEN",
+    ):
+        monkeypatch.delenv(name, raising=False)
+
+
+def write_json(tmp_path, value) -> str:
+    path = tmp_path / "payloads.json"
+    path.write_text(json.dumps(value))
+    return str(path)
+
+
+def test_read_payloads_wraps_single_payload(tmp_path):
+    path = write_json(tmp_path, {"author": "a"})
+    assert cli.read_payloads(path) == [{"author": "a"}]
+
+
+def test_read_payloads_list_of_payloads(tmp_path):
+    path = write_json(tmp_path, [{"author": "a"}, {"author": "b"}])
+    assert cli.read_payloads(path) == [{"author": "a"}, {"author": "b"}]
+
+
+def test_read_payloads_from_stdin(monkeypatch):
+    monkeypatch.setattr("sys.stdin", io.StringIO('[{"author": "a"}]'))
+    assert cli.read_payloads("-") == [{"author": "a"}]
+
+
+@pytest.mark.parametrize("value", [[1, 2], "abc", 1, None, [{"a": 1}, 2]])
+def test_read_payloads_rejects_other_shapes(tmp_path, value):
+    path = write_json(tmp_path, value)
+    with pytest.raises(ValueError, match="payload dict"):
+        cli.read_payloads(path)
+
+
+def test_read_payloads_invalid_json(tmp_path):
+    path = tmp_path / "payloads.json"
+    path.write_text("not json")
+    with pytest.raises(json.JSONDecodeError):
+        cli.read_payloads(str(path))
+
+
+def test_read_payloads_missing_file(tmp_path):
+    with pytest.raises(OSError):
+        cli.read_payloads(str(tmp_path / "missing.json"))
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["plan", "simple", "payloads.json"],
+        ["plan", "coda", "payloads.json"],
+        ["plan", "simple", "--coda-api-token", "token"],
+        ["plan", "replay", "payloads.json", "--coda-api-token", "token"],
+        ["simple", "--coda-api-token", "token"],
+        ["replay"],
+    ],
+)
+def test_main_usage_errors(argv):
+    with pytest.raises(SystemExit) as exc_info:
+        cli.main(argv)
+    assert exc_info.value.code == 2
+
+
+@pytest.mark.parametrize("value", [[1, 2], "abc"])
+def test_replay_rejects_invalid_payload_file(tmp_path, capsys, value):
+    path = write_json(tmp_path, value)
+    assert cli.main(["replay", path]) == 1
+    assert "Could not read payloads" in capsys.readouterr().out
+
+
+def test_replay_missing_payload_file(tmp_path, capsys):
+    assert cli.main(["replay", str(tmp_path / "missing.json")]) == 1
+    assert "Could not read payloads" in capsys.readouterr().out
+
+
+@requires_dotenv
+def test_plan_ready_masks_secrets(env, capsys):
+    assert cli.main(["plan", "coda"]) == 0
+    out = capsys.readouterr().out
+    assert "coda_api_token: <set>" in out
+    assert "ipcopilot_org_api_key: <set>" in out
+    assert env["IPCOPILOT_INGESTION_ENDPOINT"] in out
+    assert env["IPCOPILOT_ORG_API_KEY"] not in out
+    assert env["CODA_API_TOKEN"] not in out
+
+
+@requires_dotenv
+def test_plan_simple_counts_payloads(env, capsys):
+    assert cli.main(["plan", "simple"]) == 0
+    assert "Payloads to send: 1" in capsys.readouterr().out
+
+
+@requires_dotenv
+def test_plan_replay_counts_payloads(env, tmp_path, capsys):
+    path = write_json(tmp_path, [{"author": "a"}, {"author": "b"}])
+    assert cli.main(["plan", "replay", path]) == 0
+    assert f"Payloads to send: 2 from {path}" in capsys.readouterr().out
+
+
+@requires_dotenv
+def test_plan_missing_config(no_env, capsys):
+    assert cli.main(["plan", "simple"]) == 1
+    assert "IPCOPILOT_ORG_API_KEY" in capsys.readouterr().out
+
+
+@requires_dotenv
+def test_plan_replay_reports_config_and_missing_file(no_env, capsys):
+    assert cli.main(["plan", "replay"]) == 1
+    out = capsys.readouterr().out
+    assert "IPCOPILOT_ORG_API_KEY" in out
+    assert "A payload file is required to plan a replay" in out
+
+
+@requires_dotenv
+def test_plan_replay_invalid_payload_file(env, tmp_path, capsys):
+    path = write_json(tmp_path, [1, 2])
+    assert cli.main(["plan", "replay", path]) == 1
+    assert "Could not read payloads" in capsys.readouterr().out
+
+
+@requires_dotenv
+@pytest.mark.parametrize("command", ["simple", "coda"])
+def test_run_missing_config(no_env, capsys, command):
+    assert cli.main([command]) == 1
+    assert "IPCOPILOT_ORG_API_KEY" in capsys.readouterr().out